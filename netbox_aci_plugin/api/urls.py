@@ -7,14 +7,18 @@ from netbox.api.routers import NetBoxRouter
 from . import views
 
 app_name = "netbox_aci_plugin"
-router = NetBoxRouter()
-router.register("tenants", views.ACITenantListViewSet)
-router.register("app-profiles", views.ACIAppProfileListViewSet)
-router.register("bridge-domains", views.ACIBridgeDomainListViewSet)
-router.register(
-    "bridge-domain-subnets", views.ACIBridgeDomainSubnetListViewSet
+
+_ROUTES: tuple = (
+    ("tenants", views.ACITenantListViewSet),
+    ("app-profiles", views.ACIAppProfileListViewSet),
+    ("bridge-domains", views.ACIBridgeDomainListViewSet),
+    ("bridge-domain-subnets", views.ACIBridgeDomainSubnetListViewSet),
+    ("endpointgroups", views.ACIEndpointGroupListViewSet),
+    ("vrfs", views.ACIVRFListViewSet),
 )
-router.register("endpointgroups", views.ACIEndpointGroupListViewSet)
-router.register("vrfs", views.ACIVRFListViewSet)
+
+router = NetBoxRouter()
+for prefix, viewset in _ROUTES:
+    router.register(prefix, viewset)
 
 urlpatterns = router.urls
@@ -34,8 +34,9 @@ from .serializers import (
 class ACITenantListViewSet(NetBoxModelViewSet):
     """API view for listing ACI Tenant instances."""
 
-    queryset = ACITenant.objects.prefetch_related(
+    queryset = ACITenant.objects.select_related(
         "nb_tenant",
+    ).prefetch_related(
         "tags",
     )
     serializer_class = ACITenantSerializer
@@ -45,9 +46,10 @@ class ACITenantListViewSet(NetBoxModelViewSet):
 class ACIAppProfileListViewSet(NetBoxModelViewSet):
     """API view for listing ACI Application Profile instances."""
 
-    queryset = ACIAppProfile.objects.prefetch_related(
-        "aci_tenant",
+    queryset = ACIAppProfile.objects.select_related(
+        "aci_tenant__nb_tenant",
         "nb_tenant",
+    ).prefetch_related(
         "tags",
     )
     serializer_class = ACIAppProfileSerializer
@@ -57,10 +59,11 @@ class ACIAppProfileListViewSet(NetBoxModelViewSet):
 class ACIVRFListViewSet(NetBoxModelViewSet):
     """API view for listing ACI VRF instances."""
 
-    queryset = ACIVRF.objects.prefetch_related(
-        "aci_tenant",
+    queryset = ACIVRF.objects.select_related(
+        "aci_tenant__nb_tenant",
         "nb_tenant",
         "nb_vrf",
+    ).prefetch_related(
         "tags",
     )
     serializer_class = ACIVRFSerializer
@@ -70,9 +73,12 @@ class ACIVRFListViewSet(NetBoxModelViewSet):
 class ACIBridgeDomainListViewSet(NetBoxModelViewSet):
     """API view for listing ACI Bridge Domain instances."""
 
-    queryset = ACIBridgeDomain.objects.prefetch_related(
-        "aci_vrf",
+    queryset = ACIBridgeDomain.objects.select_related(
+        "aci_vrf__aci_tenant__nb_tenant",
+        "aci_vrf__nb_tenant",
+        "aci_vrf__nb_vrf",
         "nb_tenant",
+    ).prefetch_related(
         "tags",
     )
     serializer_class = ACIBridgeDomainSerializer
@@ -82,10 +88,14 @@ class ACIBridgeDomainListViewSet(NetBoxModelViewSet):
 class ACIBridgeDomainSubnetListViewSet(NetBoxModelViewSet):
     """API view for listing ACI Bridge Domain Subnet instances."""
 
-    queryset = ACIBridgeDomainSubnet.objects.prefetch_related(
-        "aci_bridge_domain",
+    queryset = ACIBridgeDomainSubnet.objects.select_related(
+        "aci_bridge_domain__aci_vrf__aci_tenant__nb_tenant",
+        "aci_bridge_domain__aci_vrf__nb_tenant",
+        "aci_bridge_domain__aci_vrf__nb_vrf",
+        "aci_bridge_domain__nb_tenant",
         "gateway_ip_address",
         "nb_tenant",
+    ).prefetch_related(
         "tags",
     )
     serializer_class = ACIBridgeDomainSubnetSerializer
@@ -95,10 +105,15 @@ class ACIBridgeDomainSubnetListViewSet(NetBoxModelViewSet):
 class ACIEndpointGroupListViewSet(NetBoxModelViewSet):
     """API view for listing ACI Endpoint Group instances."""
 
-    queryset = ACIEndpointGroup.objects.prefetch_related(
-        "aci_app_profile",
-        "aci_bridge_domain",
+    queryset = ACIEndpointGroup.objects.select_related(
+        "aci_app_profile__aci_tenant__nb_tenant",
+        "aci_app_profile__nb_tenant",
+        "aci_bridge_domain__aci_vrf__aci_tenant__nb_tenant",
+        "aci_bridge_domain__aci_vrf__nb_tenant",
+        "aci_bridge_domain__aci_vrf__nb_vrf",
+        "aci_bridge_domain__nb_tenant",
         "nb_tenant",
+    ).prefetch_related(
         "tags",
     )
     serializer_class = ACIEndpointGroupSerializer
@@ -37,10 +37,68 @@ from ..models.tenant_networks import (
 )
 from ..models.tenants import ACITenant
 
+
+def _null_boolean_field(label: str) -> forms.NullBooleanField:
+    """Return an optional boolean field rendered as select with blank."""
+    return forms.NullBooleanField(
+        required=False,
+        label=label,
+        widget=forms.Select(
+            choices=BOOLEAN_WITH_BLANK_CHOICES,
+        ),
+    )
+
+
+def _is_initial_pk(form: NetBoxModelForm, field_name: str, pk) -> bool:
+    """Return whether the initial value of a form field is the given pk."""
+    value = form.initial.get(field_name)
+    return str(getattr(value, "pk", value)) == str(pk)
+
+
+def _set_initial_nb_tenant_group(form: NetBoxModelForm) -> None:
+    """Set the initial NetBox tenant group from the instance's tenant."""
+    # Use the already loaded NetBox tenant of the instance instead of
+    # resolving the group with a lookup via initial_params, unless another
+    # NetBox tenant is passed as initial value.
+    if (
+        form.instance.nb_tenant_id
+        and not form.initial.get("nb_tenant_group")
+        and _is_initial_pk(form, "nb_tenant", form.instance.nb_tenant_id)
+    ):
+        nb_tenant = form.instance.nb_tenant
+        form.fields["nb_tenant_group"].initial = nb_tenant.group_id
+
+
+# Form fields are deep-copied for every form instance, so a single
+# declaration can be shared between the form classes.
+_COMMENT_FIELD = CommentField()
+
+
 #
 # VRF forms
 #
 
+_VRF_POLICY_CONTROL_FIELDSET = FieldSet(
+    "pc_enforcement_direction",
+    "pc_enforcement_preference",
+    "bd_enforcement_enabled",
+    "preferred_group_enabled",
+    name=_("Policy Control Settings"),
+)
+_VRF_ENDPOINT_LEARNING_FIELDSET = FieldSet(
+    "ip_data_plane_learning_enabled",
+    name=_("Endpoint Learning Settings"),
+)
+_VRF_MULTICAST_FIELDSET = FieldSet(
+    "pim_ipv4_enabled",
+    "pim_ipv6_enabled",
+    name=_("Multicast Settings"),
+)
+_VRF_ADDITIONAL_FIELDSET = FieldSet(
+    "dns_labels",
+    name=_("Additional Settings"),
+)
+
 
 class ACIVRFForm(NetBoxModelForm):
     """NetBox form for ACI VRF model."""
@@ -124,7 +182,7 @@ class ACIVRFForm(NetBoxModelForm):
             "Default is disabled."
         ),
     )
-    comments = CommentField()
+    comments = _COMMENT_FIELD
 
     fieldsets: tuple = (
         FieldSet(
@@ -135,26 +193,10 @@ class ACIVRFForm(NetBoxModelForm):
             "tags",
             name=_("ACI VRF"),
         ),
-        FieldSet(
-            "pc_enforcement_direction",
-            "pc_enforcement_preference",
-            "bd_enforcement_enabled",
-            "preferred_group_enabled",
-            name=_("Policy Control Settings"),
-        ),
-        FieldSet(
-            "ip_data_plane_learning_enabled",
-            name=_("Endpoint Learning Settings"),
-        ),
-        FieldSet(
-            "pim_ipv4_enabled",
-            "pim_ipv6_enabled",
-            name=_("Multicast Settings"),
-        ),
-        FieldSet(
-            "dns_labels",
-            name=_("Additional Settings"),
-        ),
+        _VRF_POLICY_CONTROL_FIELDSET,
+        _VRF_ENDPOINT_LEARNING_FIELDSET,
+        _VRF_MULTICAST_FIELDSET,
+        _VRF_ADDITIONAL_FIELDSET,
         FieldSet(
             "nb_tenant_group",
             "nb_tenant",
@@ -187,6 +229,12 @@ class ACIVRFForm(NetBoxModelForm):
             "tags",
         )
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Extend form initialization with the NetBox tenant group."""
+        super().__init__(*args, **kwargs)
+
+        _set_initial_nb_tenant_group(self)
+
 
 class ACIVRFBulkEditForm(NetBoxModelBulkEditForm):
     """NetBox bulk edit form for ACI VRF model."""
@@ -216,23 +264,15 @@ class ACIVRFBulkEditForm(NetBoxModelBulkEditForm):
         required=False,
         label=_("NetBox VRF"),
     )
-    bd_enforcement_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Enabled Bridge Domain enforcement"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    bd_enforcement_enabled = _null_boolean_field(
+        _("Enabled Bridge Domain enforcement")
     )
     dns_labels = forms.CharField(
         required=False,
         label=_("DNS labels"),
     )
-    ip_data_plane_learning_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Enabled IP data plane learning"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    ip_data_plane_learning_enabled = _null_boolean_field(
+        _("Enabled IP data plane learning")
     )
     pc_enforcement_direction = forms.ChoiceField(
         choices=add_blank_choice(VRFPCEnforcementDirectionChoices),
@@ -244,28 +284,10 @@ class ACIVRFBulkEditForm(NetBoxModelBulkEditForm):
         required=False,
         label=_("Policy control enforcement preference"),
     )
-    pim_ipv4_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Enabled PIM (multicast) IPv4"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    pim_ipv6_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Enabled PIM (multicast) IPv6"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    preferred_group_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Enabled preferred group"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    comments = CommentField()
+    pim_ipv4_enabled = _null_boolean_field(_("Enabled PIM (multicast) IPv4"))
+    pim_ipv6_enabled = _null_boolean_field(_("Enabled PIM (multicast) IPv6"))
+    preferred_group_enabled = _null_boolean_field(_("Enabled preferred group"))
+    comments = _COMMENT_FIELD
 
     model = ACIVRF
     fieldsets: tuple = (
@@ -277,26 +299,10 @@ class ACIVRFBulkEditForm(NetBoxModelBulkEditForm):
             "tags",
             name=_("ACI VRF"),
         ),
-        FieldSet(
-            "pc_enforcement_direction",
-            "pc_enforcement_preference",
-            "bd_enforcement_enabled",
-            "preferred_group_enabled",
-            name=_("Policy Control Settings"),
-        ),
-        FieldSet(
-            "ip_data_plane_learning_enabled",
-            name=_("Endpoint Learning Settings"),
-        ),
-        FieldSet(
-            "pim_ipv4_enabled",
-            "pim_ipv6_enabled",
-            name=_("Multicast Settings"),
-        ),
-        FieldSet(
-            "dns_labels",
-            name=_("Additional Settings"),
-        ),
+        _VRF_POLICY_CONTROL_FIELDSET,
+        _VRF_ENDPOINT_LEARNING_FIELDSET,
+        _VRF_MULTICAST_FIELDSET,
+        _VRF_ADDITIONAL_FIELDSET,
         FieldSet(
             "nb_tenant",
             name=_("NetBox Tenancy"),
@@ -333,26 +339,10 @@ class ACIVRFFilterForm(NetBoxModelFilterSetForm):
             "description",
             name="Attributes",
         ),
-        FieldSet(
-            "pc_enforcement_direction",
-            "pc_enforcement_preference",
-            "bd_enforcement_enabled",
-            "preferred_group_enabled",
-            name=_("Policy Control Settings"),
-        ),
-        FieldSet(
-            "ip_data_plane_learning_enabled",
-            name=_("Endpoint Learning Settings"),
-        ),
-        FieldSet(
-            "pim_ipv4_enabled",
-            "pim_ipv6_enabled",
-            name=_("Multicast Settings"),
-        ),
-        FieldSet(
-            "dns_labels",
-            name=_("Additional Settings"),
-        ),
+        _VRF_POLICY_CONTROL_FIELDSET,
+        _VRF_ENDPOINT_LEARNING_FIELDSET,
+        _VRF_MULTICAST_FIELDSET,
+        _VRF_ADDITIONAL_FIELDSET,
         FieldSet(
             "nb_tenant_group_id",
             "nb_tenant_id",
@@ -400,23 +390,15 @@ class ACIVRFFilterForm(NetBoxModelFilterSetForm):
         required=False,
         label=_("NetBox VRF"),
     )
-    bd_enforcement_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Enabled Bridge Domain enforcement"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    bd_enforcement_enabled = _null_boolean_field(
+        _("Enabled Bridge Domain enforcement")
     )
     dns_labels = forms.CharField(
         required=False,
         label=_("DNS labels"),
     )
-    ip_data_plane_learning_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Enabled IP data plane learning"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    ip_data_plane_learning_enabled = _null_boolean_field(
+        _("Enabled IP data plane learning")
     )
     pc_enforcement_direction = forms.ChoiceField(
         choices=VRFPCEnforcementDirectionChoices,
@@ -428,27 +410,9 @@ class ACIVRFFilterForm(NetBoxModelFilterSetForm):
         required=False,
         label=_("Policy control enforcement preference"),
     )
-    pim_ipv4_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Enabled PIM (multicast) IPv4"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    pim_ipv6_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Enabled PIM (multicast) IPv6"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    preferred_group_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Enabled preferred group"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
+    pim_ipv4_enabled = _null_boolean_field(_("Enabled PIM (multicast) IPv4"))
+    pim_ipv6_enabled = _null_boolean_field(_("Enabled PIM (multicast) IPv6"))
+    preferred_group_enabled = _null_boolean_field(_("Enabled preferred group"))
     tag = TagFilterField(ACIVRF)
 
 
@@ -515,6 +479,42 @@ class ACIVRFImportForm(NetBoxModelImportForm):
 # Bridge Domain forms
 #
 
+_BD_ROUTING_FIELDSET = FieldSet(
+    "unicast_routing_enabled",
+    "advertise_host_routes_enabled",
+    "ep_move_detection_enabled",
+    "mac_address",
+    "virtual_mac_address",
+    name=_("Routing Settings"),
+)
+_BD_FORWARDING_FIELDSET = FieldSet(
+    "arp_flooding_enabled",
+    "unknown_unicast",
+    "unknown_ipv4_multicast",
+    "unknown_ipv6_multicast",
+    "multi_destination_flooding",
+    name=_("Forwarding Method Settings"),
+)
+_BD_ENDPOINT_LEARNING_FIELDSET = FieldSet(
+    "ip_data_plane_learning_enabled",
+    "limit_ip_learn_enabled",
+    "clear_remote_mac_enabled",
+    name=_("Endpoint Learning Settings"),
+)
+_BD_MULTICAST_FIELDSET = FieldSet(
+    "pim_ipv4_enabled",
+    "pim_ipv6_enabled",
+    "igmp_interface_policy_name",
+    "igmp_snooping_policy_name",
+    "pim_ipv4_source_filter",
+    "pim_ipv4_destination_filter",
+    name=_("Multicast Settings"),
+)
+_BD_ADDITIONAL_FIELDSET = FieldSet(
+    "dhcp_labels",
+    name=_("Additional Settings"),
+)
+
 
 class ACIBridgeDomainForm(NetBoxModelForm):
     """NetBox form for ACI Bridge Domain model."""
@@ -582,7 +582,7 @@ class ACIBridgeDomainForm(NetBoxModelForm):
             "Default is enabled."
         ),
     )
-    limit_ip_learn_to_subnet = forms.BooleanField(
+    limit_ip_learn_enabled = forms.BooleanField(
         required=False,
         label=_("Limit IP learning to subnet"),
         help_text=_(
@@ -650,7 +650,7 @@ class ACIBridgeDomainForm(NetBoxModelForm):
             "Default is 'proxy'."
         ),
     )
-    comments = CommentField()
+    comments = _COMMENT_FIELD
 
     fieldsets: tuple = (
         FieldSet(
@@ -662,41 +662,11 @@ class ACIBridgeDomainForm(NetBoxModelForm):
             "tags",
             name=_("ACI Bridge Domain"),
         ),
-        FieldSet(
-            "unicast_routing_enabled",
-            "advertise_host_routes_enabled",
-            "ep_move_detection_enabled",
-            "mac_address",
-            "virtual_mac_address",
-            name=_("Routing Settings"),
-        ),
-        FieldSet(
-            "arp_flooding_enabled",
-            "unknown_unicast",
-            "unknown_ipv4_multicast",
-            "unknown_ipv6_multicast",
-            "multi_destination_flooding",
-            name=_("Forwarding Method Settings"),
-        ),
-        FieldSet(
-            "ip_data_plane_learning_enabled",
-            "limit_ip_learn_enabled",
-            "clear_remote_mac_enabled",
-            name=_("Endpoint Learning Settings"),
-        ),
-        FieldSet(
-            "pim_ipv4_enabled",
-            "pim_ipv6_enabled",
-            "igmp_interface_policy_name",
-            "igmp_snooping_policy_name",
-            "pim_ipv4_source_filter",
-            "pim_ipv4_destination_filter",
-            name=_("Multicast Settings"),
-        ),
-        FieldSet(
-            "dhcp_labels",
-            name=_("Additional Settings"),
-        ),
+        _BD_ROUTING_FIELDSET,
+        _BD_FORWARDING_FIELDSET,
+        _BD_ENDPOINT_LEARNING_FIELDSET,
+        _BD_MULTICAST_FIELDSET,
+        _BD_ADDITIONAL_FIELDSET,
         FieldSet(
             "nb_tenant_group",
             "nb_tenant",
@@ -736,6 +706,22 @@ class ACIBridgeDomainForm(NetBoxModelForm):
             "tags",
         )
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Extend form initialization with parent and tenancy initials."""
+        super().__init__(*args, **kwargs)
+
+        # Set the initial ACITenant from the already loaded parent ACIVRF
+        # instead of resolving it with a lookup via initial_params, unless
+        # another parent ACIVRF is passed as initial value.
+        if (
+            self.instance.pk
+            and not self.initial.get("aci_tenant")
+            and _is_initial_pk(self, "aci_vrf", self.instance.aci_vrf_id)
+        ):
+            aci_vrf = self.instance.aci_vrf
+            self.fields["aci_tenant"].initial = aci_vrf.aci_tenant_id
+        _set_initial_nb_tenant_group(self)
+
 
 class ACIBridgeDomainBulkEditForm(NetBoxModelBulkEditForm):
     """NetBox bulk edit form for ACI Bridge Domain model."""
@@ -760,37 +746,19 @@ class ACIBridgeDomainBulkEditForm(NetBoxModelBulkEditForm):
         required=False,
         label=_("NetBox Tenant"),
     )
-    advertise_host_routes_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Advertise host routes enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    advertise_host_routes_enabled = _null_boolean_field(
+        _("Advertise host routes enabled")
     )
-    arp_flooding_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("ARP flooding enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    clear_remote_mac_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Clear remote MAC entries enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    arp_flooding_enabled = _null_boolean_field(_("ARP flooding enabled"))
+    clear_remote_mac_enabled = _null_boolean_field(
+        _("Clear remote MAC entries enabled")
     )
     dhcp_labels = forms.CharField(
         required=False,
         label=_("DHCP labels"),
     )
-    ep_move_detection_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("EP move detection enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    ep_move_detection_enabled = _null_boolean_field(
+        _("EP move detection enabled")
     )
     igmp_interface_policy_name = forms.CharField(
         required=False,
@@ -800,19 +768,11 @@ class ACIBridgeDomainBulkEditForm(NetBoxModelBulkEditForm):
         required=False,
         label=_("IGMP snooping policy name"),
     )
-    ip_data_plane_learning_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("IP data plane learning enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    ip_data_plane_learning_enabled = _null_boolean_field(
+        _("IP data plane learning enabled")
     )
-    limit_ip_learn_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Limit IP learning to subnet enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    limit_ip_learn_enabled = _null_boolean_field(
+        _("Limit IP learning to subnet enabled")
     )
     mac_address = forms.CharField(
         required=False,
@@ -823,13 +783,7 @@ class ACIBridgeDomainBulkEditForm(NetBoxModelBulkEditForm):
         required=False,
         label=_("Multi destination flooding"),
     )
-    pim_ipv4_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("PIM (multicast) IPv4 enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
+    pim_ipv4_enabled = _null_boolean_field(_("PIM (multicast) IPv4 enabled"))
     pim_ipv4_destination_filter = forms.CharField(
         required=False,
         label=_("PIM destination filter"),
@@ -838,20 +792,8 @@ class ACIBridgeDomainBulkEditForm(NetBoxModelBulkEditForm):
         required=False,
         label=_("PIM source filter"),
     )
-    pim_ipv6_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("PIM (multicast) IPv6 enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    unicast_routing_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Unicast routing enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
+    pim_ipv6_enabled = _null_boolean_field(_("PIM (multicast) IPv6 enabled"))
+    unicast_routing_enabled = _null_boolean_field(_("Unicast routing enabled"))
     unknown_ipv4_multicast = forms.ChoiceField(
         choices=add_blank_choice(BDUnknownMulticastChoices),
         required=False,
@@ -871,7 +813,7 @@ class ACIBridgeDomainBulkEditForm(NetBoxModelBulkEditForm):
         required=False,
         label=_("Virtual MAC address"),
     )
-    comments = CommentField()
+    comments = _COMMENT_FIELD
 
     model = ACIBridgeDomain
     fieldsets: tuple = (
@@ -883,41 +825,11 @@ class ACIBridgeDomainBulkEditForm(NetBoxModelBulkEditForm):
             "tags",
             name=_("ACI Bridge Domain"),
         ),
-        FieldSet(
-            "unicast_routing_enabled",
-            "advertise_host_routes_enabled",
-            "ep_move_detection_enabled",
-            "mac_address",
-            "virtual_mac_address",
-            name=_("Routing Settings"),
-        ),
-        FieldSet(
-            "arp_flooding_enabled",
-            "unknown_unicast",
-            "unknown_ipv4_multicast",
-            "unknown_ipv6_multicast",
-            "multi_destination_flooding",
-            name=_("Forwarding Method Settings"),
-        ),
-        FieldSet(
-            "ip_data_plane_learning_enabled",
-            "limit_ip_learn_enabled",
-            "clear_remote_mac_enabled",
-            name=_("Endpoint Learning Settings"),
-        ),
-        FieldSet(
-            "pim_ipv4_enabled",
-            "pim_ipv6_enabled",
-            "igmp_interface_policy_name",
-            "igmp_snooping_policy_name",
-            "pim_ipv4_source_filter",
-            "pim_ipv4_destination_filter",
-            name=_("Multicast Settings"),
-        ),
-        FieldSet(
-            "dhcp_labels",
-            name=_("Additional Settings"),
-        ),
+        _BD_ROUTING_FIELDSET,
+        _BD_FORWARDING_FIELDSET,
+        _BD_ENDPOINT_LEARNING_FIELDSET,
+        _BD_MULTICAST_FIELDSET,
+        _BD_ADDITIONAL_FIELDSET,
         FieldSet(
             "nb_tenant",
             name=_("NetBox Tenancy"),
@@ -955,41 +867,11 @@ class ACIBridgeDomainFilterForm(NetBoxModelFilterSetForm):
             "description",
             name="Attributes",
         ),
-        FieldSet(
-            "unicast_routing_enabled",
-            "advertise_host_routes_enabled",
-            "ep_move_detection_enabled",
-            "mac_address",
-            "virtual_mac_address",
-            name=_("Routing Settings"),
-        ),
-        FieldSet(
-            "arp_flooding_enabled",
-            "unknown_unicast",
-            "unknown_ipv4_multicast",
-            "unknown_ipv6_multicast",
-            "multi_destination_flooding",
-            name=_("Forwarding Method Settings"),
-        ),
-        FieldSet(
-            "ip_data_plane_learning_enabled",
-            "limit_ip_learn_enabled",
-            "clear_remote_mac_enabled",
-            name=_("Endpoint Learning Settings"),
-        ),
-        FieldSet(
-            "pim_ipv4_enabled",
-            "pim_ipv6_enabled",
-            "igmp_interface_policy_name",
-            "igmp_snooping_policy_name",
-            "pim_ipv4_source_filter",
-            "pim_ipv4_destination_filter",
-            name=_("Multicast Settings"),
-        ),
-        FieldSet(
-            "dhcp_labels",
-            name=_("Additional Settings"),
-        ),
+        _BD_ROUTING_FIELDSET,
+        _BD_FORWARDING_FIELDSET,
+        _BD_ENDPOINT_LEARNING_FIELDSET,
+        _BD_MULTICAST_FIELDSET,
+        _BD_ADDITIONAL_FIELDSET,
         FieldSet(
             "nb_tenant_group_id",
             "nb_tenant_id",
@@ -1026,78 +908,34 @@ class ACIBridgeDomainFilterForm(NetBoxModelFilterSetForm):
         required=False,
         label=_("NetBox tenant"),
     )
-    advertise_host_routes_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Advertise host routes enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    arp_flooding_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("ARP flooding enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    advertise_host_routes_enabled = _null_boolean_field(
+        _("Advertise host routes enabled")
     )
-    clear_remote_mac_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Clear remote MAC entries enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    arp_flooding_enabled = _null_boolean_field(_("ARP flooding enabled"))
+    clear_remote_mac_enabled = _null_boolean_field(
+        _("Clear remote MAC entries enabled")
     )
     dhcp_labels = forms.CharField(
         required=False,
         label=_("DHCP labels"),
     )
-    ep_move_detection_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("EP move detection enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    ep_move_detection_enabled = _null_boolean_field(
+        _("EP move detection enabled")
     )
-    ip_data_plane_learning_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("IP data plane learning enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    ip_data_plane_learning_enabled = _null_boolean_field(
+        _("IP data plane learning enabled")
     )
-    limit_ip_learn_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Limit IP learning to subnet enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    limit_ip_learn_enabled = _null_boolean_field(
+        _("Limit IP learning to subnet enabled")
     )
     multi_destination_flooding = forms.ChoiceField(
         choices=BDMultiDestinationFloodingChoices,
         required=False,
         label=_("Multi destination flooding"),
     )
-    pim_ipv4_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("PIM (multicast) IPv4 enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    pim_ipv6_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("PIM (multicast) IPv6 enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    unicast_routing_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Unicast routing enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
+    pim_ipv4_enabled = _null_boolean_field(_("PIM (multicast) IPv4 enabled"))
+    pim_ipv6_enabled = _null_boolean_field(_("PIM (multicast) IPv6 enabled"))
+    unicast_routing_enabled = _null_boolean_field(_("Unicast routing enabled"))
     unknown_ipv4_multicast = forms.ChoiceField(
         choices=BDUnknownMulticastChoices,
         required=False,
@@ -1220,6 +1058,26 @@ class ACIBridgeDomainImportForm(NetBoxModelImportForm):
 # Bridge Domain Subnet forms
 #
 
+_BD_SUBNET_SCOPE_FIELDSET = FieldSet(
+    "advertised_externally_enabled",
+    "shared_enabled",
+    name=_("Scope Settings"),
+)
+_BD_SUBNET_CONTROL_FIELDSET = FieldSet(
+    "igmp_querier_enabled",
+    "no_default_gateway",
+    name=_("Subnet Control Settings"),
+)
+_BD_SUBNET_ENDPOINT_LEARNING_FIELDSET = FieldSet(
+    "ip_data_plane_learning_enabled",
+    name=_("Endpoint Learning Settings"),
+)
+_BD_SUBNET_IPV6_FIELDSET = FieldSet(
+    "nd_ra_enabled",
+    "nd_ra_prefix_policy_name",
+    name=_("IPv6 Settings"),
+)
+
 
 class ACIBridgeDomainSubnetForm(NetBoxModelForm):
     """NetBox form for ACI Bridge Domain Subnet model."""
@@ -1331,7 +1189,7 @@ class ACIBridgeDomainSubnetForm(NetBoxModelForm):
             "Treat the gateway IP as virtual IP. Default is disabled."
         ),
     )
-    comments = CommentField()
+    comments = _COMMENT_FIELD
 
     fieldsets: tuple = (
         FieldSet(
@@ -1348,25 +1206,10 @@ class ACIBridgeDomainSubnetForm(NetBoxModelForm):
             "virtual_ip_enabled",
             name=_("ACI Bridge Domain Subnet"),
         ),
-        FieldSet(
-            "advertised_externally_enabled",
-            "shared_enabled",
-            name=_("Scope Settings"),
-        ),
-        FieldSet(
-            "igmp_querier_enabled",
-            "no_default_gateway",
-            name=_("Subnet Control Settings"),
-        ),
-        FieldSet(
-            "ip_data_plane_learning_enabled",
-            name=_("Endpoint Learning Settings"),
-        ),
-        FieldSet(
-            "nd_ra_enabled",
-            "nd_ra_prefix_policy_name",
-            name=_("IPv6 Settings"),
-        ),
+        _BD_SUBNET_SCOPE_FIELDSET,
+        _BD_SUBNET_CONTROL_FIELDSET,
+        _BD_SUBNET_ENDPOINT_LEARNING_FIELDSET,
+        _BD_SUBNET_IPV6_FIELDSET,
         FieldSet(
             "nb_tenant_group",
             "nb_tenant",
@@ -1397,6 +1240,27 @@ class ACIBridgeDomainSubnetForm(NetBoxModelForm):
             "tags",
         )
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Extend form initialization with parent and tenancy initials."""
+        super().__init__(*args, **kwargs)
+
+        # Set the initial ACIVRF and ACITenant from the already loaded parent
+        # ACIBridgeDomain instead of resolving them via initial_params, unless
+        # another parent ACIBridgeDomain or ACIVRF is passed as initial value.
+        if self.instance.pk and _is_initial_pk(
+            self, "aci_bridge_domain", self.instance.aci_bridge_domain_id
+        ):
+            aci_vrf = self.instance.aci_vrf
+            aci_vrf_passed = bool(self.initial.get("aci_vrf"))
+            if not aci_vrf_passed:
+                self.fields["aci_vrf"].initial = aci_vrf.pk
+            if not self.initial.get("aci_tenant") and (
+                not aci_vrf_passed
+                or _is_initial_pk(self, "aci_vrf", aci_vrf.pk)
+            ):
+                self.fields["aci_tenant"].initial = aci_vrf.aci_tenant_id
+        _set_initial_nb_tenant_group(self)
+
 
 class ACIBridgeDomainSubnetBulkEditForm(NetBoxModelBulkEditForm):
     """NetBox bulk edit form for ACI Bridge Domain Subnet model."""
@@ -1421,67 +1285,25 @@ class ACIBridgeDomainSubnetBulkEditForm(NetBoxModelBulkEditForm):
         required=False,
         label=_("NetBox Tenant"),
     )
-    advertised_externally_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Advertised externally enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    advertised_externally_enabled = _null_boolean_field(
+        _("Advertised externally enabled")
     )
-    igmp_querier_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("IGMP querier enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    ip_data_plane_learning_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("IP data plane learning enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    no_default_gateway = forms.NullBooleanField(
-        required=False,
-        label=_("No default SVI gateway"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    nd_ra_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("ND RA enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    igmp_querier_enabled = _null_boolean_field(_("IGMP querier enabled"))
+    ip_data_plane_learning_enabled = _null_boolean_field(
+        _("IP data plane learning enabled")
     )
+    no_default_gateway = _null_boolean_field(_("No default SVI gateway"))
+    nd_ra_enabled = _null_boolean_field(_("ND RA enabled"))
     nd_ra_prefix_policy_name = forms.CharField(
         required=False,
         label=_("ND RA prefix policy name"),
     )
-    preferred_ip_address_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Preferred (Primary) IP address enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    shared_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Shared enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    virtual_ip_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Virtual IP enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    preferred_ip_address_enabled = _null_boolean_field(
+        _("Preferred (Primary) IP address enabled")
     )
-    comments = CommentField()
+    shared_enabled = _null_boolean_field(_("Shared enabled"))
+    virtual_ip_enabled = _null_boolean_field(_("Virtual IP enabled"))
+    comments = _COMMENT_FIELD
 
     model = ACIBridgeDomainSubnet
     fieldsets: tuple = (
@@ -1496,25 +1318,10 @@ class ACIBridgeDomainSubnetBulkEditForm(NetBoxModelBulkEditForm):
             "virtual_ip_enabled",
             name=_("ACI Bridge Domain Subnet"),
         ),
-        FieldSet(
-            "advertised_externally_enabled",
-            "shared_enabled",
-            name=_("Scope Settings"),
-        ),
-        FieldSet(
-            "igmp_querier_enabled",
-            "no_default_gateway",
-            name=_("Subnet Control Settings"),
-        ),
-        FieldSet(
-            "ip_data_plane_learning_enabled",
-            name=_("Endpoint Learning Settings"),
-        ),
-        FieldSet(
-            "nd_ra_enabled",
-            "nd_ra_prefix_policy_name",
-            name=_("IPv6 Settings"),
-        ),
+        _BD_SUBNET_SCOPE_FIELDSET,
+        _BD_SUBNET_CONTROL_FIELDSET,
+        _BD_SUBNET_ENDPOINT_LEARNING_FIELDSET,
+        _BD_SUBNET_IPV6_FIELDSET,
         FieldSet(
             "nb_tenant",
             name=_("NetBox Tenancy"),
@@ -1552,25 +1359,10 @@ class ACIBridgeDomainSubnetFilterForm(NetBoxModelFilterSetForm):
             "virtual_ip_enabled",
             name="Attributes",
         ),
-        FieldSet(
-            "advertised_externally_enabled",
-            "shared_enabled",
-            name=_("Scope Settings"),
-        ),
-        FieldSet(
-            "igmp_querier_enabled",
-            "no_default_gateway",
-            name=_("Subnet Control Settings"),
-        ),
-        FieldSet(
-            "ip_data_plane_learning_enabled",
-            name=_("Endpoint Learning Settings"),
-        ),
-        FieldSet(
-            "nd_ra_enabled",
-            "nd_ra_prefix_policy_name",
-            name=_("IPv6 Settings"),
-        ),
+        _BD_SUBNET_SCOPE_FIELDSET,
+        _BD_SUBNET_CONTROL_FIELDSET,
+        _BD_SUBNET_ENDPOINT_LEARNING_FIELDSET,
+        _BD_SUBNET_IPV6_FIELDSET,
         FieldSet(
             "nb_tenant_group_id",
             "nb_tenant_id",
@@ -1625,66 +1417,24 @@ class ACIBridgeDomainSubnetFilterForm(NetBoxModelFilterSetForm):
         required=False,
         label=_("NetBox tenant"),
     )
-    advertised_externally_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Advertised externally enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    igmp_querier_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("IGMP querier enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    advertised_externally_enabled = _null_boolean_field(
+        _("Advertised externally enabled")
     )
-    ip_data_plane_learning_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("IP data plane learning enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    no_default_gateway = forms.NullBooleanField(
-        required=False,
-        label=_("No default SVI gateway"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    nd_ra_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("ND RA enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    igmp_querier_enabled = _null_boolean_field(_("IGMP querier enabled"))
+    ip_data_plane_learning_enabled = _null_boolean_field(
+        _("IP data plane learning enabled")
     )
+    no_default_gateway = _null_boolean_field(_("No default SVI gateway"))
+    nd_ra_enabled = _null_boolean_field(_("ND RA enabled"))
     nd_ra_prefix_policy_name = forms.CharField(
         required=False,
         label=_("ND RA prefix policy name"),
     )
-    preferred_ip_address_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Preferred (Primary) IP address enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    shared_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Shared enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
-    )
-    virtual_ip_enabled = forms.NullBooleanField(
-        required=False,
-        label=_("Virtual IP enabled"),
-        widget=forms.Select(
-            choices=BOOLEAN_WITH_BLANK_CHOICES,
-        ),
+    preferred_ip_address_enabled = _null_boolean_field(
+        _("Preferred (Primary) IP address enabled")
     )
+    shared_enabled = _null_boolean_field(_("Shared enabled"))
+    virtual_ip_enabled = _null_boolean_field(_("Virtual IP enabled"))
     tag = TagFilterField(ACIBridgeDomainSubnet)
 
 
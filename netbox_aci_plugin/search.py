@@ -12,6 +12,19 @@ from .models.tenant_networks import (
 )
 from .models.tenants import ACITenant
 
+# All ACI objects are searched and displayed by the same name and
+# description fields.
+_COMMON_FIELDS: tuple = (
+    ("name", 100),
+    ("name_alias", 300),
+    ("description", 500),
+)
+_COMMON_DISPLAY_ATTRS: tuple = (
+    "name",
+    "name_alias",
+    "description",
+)
+
 
 @register_search
 class ACITenantIndex(SearchIndex):
@@ -19,17 +32,8 @@ class ACITenantIndex(SearchIndex):
 
     model = ACITenant
 
-    fields: tuple = (
-        ("name", 100),
-        ("name_alias", 300),
-        ("description", 500),
-    )
-    display_attrs: tuple = (
-        "name",
-        "name_alias",
-        "description",
-        "nb_tenant",
-    )
+    fields: tuple = _COMMON_FIELDS
+    display_attrs: tuple = _COMMON_DISPLAY_ATTRS + ("nb_tenant",)
 
 
 @register_search
@@ -38,15 +42,8 @@ class ACIAppProfileIndex(SearchIndex):
 
     model = ACIAppProfile
 
-    fields: tuple = (
-        ("name", 100),
-        ("name_alias", 300),
-        ("description", 500),
-    )
-    display_attrs: tuple = (
-        "name",
-        "name_alias",
-        "description",
+    fields: tuple = _COMMON_FIELDS
+    display_attrs: tuple = _COMMON_DISPLAY_ATTRS + (
         "aci_tenant",
         "nb_tenant",
     )
@@ -58,15 +55,8 @@ class ACIVRFIndex(SearchIndex):
 
     model = ACIVRF
 
-    fields: tuple = (
-        ("name", 100),
-        ("name_alias", 300),
-        ("description", 500),
-    )
-    display_attrs: tuple = (
-        "name",
-        "alias",
-        "description",
+    fields: tuple = _COMMON_FIELDS
+    display_attrs: tuple = _COMMON_DISPLAY_ATTRS + (
         "aci_tenant",
         "nb_tenant",
         "nb_vrf",
@@ -79,15 +69,8 @@ class ACIBridgeDomainIndex(SearchIndex):
 
     model = ACIBridgeDomain
 
-    fields: tuple = (
-        ("name", 100),
-        ("name_alias", 300),
-        ("description", 500),
-    )
-    display_attrs: tuple = (
-        "name",
-        "name_alias",
-        "description",
+    fields: tuple = _COMMON_FIELDS
+    display_attrs: tuple = _COMMON_DISPLAY_ATTRS + (
         "aci_vrf",
         "nb_tenant",
     )
@@ -99,15 +82,8 @@ class ACIBridgeDomainSubnetIndex(SearchIndex):
 
     model = ACIBridgeDomainSubnet
 
-    fields: tuple = (
-        ("name", 100),
-        ("name_alias", 300),
-        ("description", 500),
-    )
-    display_attrs: tuple = (
-        "name",
-        "name_alias",
-        "description",
+    fields: tuple = _COMMON_FIELDS
+    display_attrs: tuple = _COMMON_DISPLAY_ATTRS + (
         "aci_bridge_domain",
         "gateway_ip_address",
         "nb_tenant",
@@ -120,15 +96,8 @@ class ACIEndpointGroupIndex(SearchIndex):
 
     model = ACIEndpointGroup
 
-    fields: tuple = (
-        ("name", 100),
-        ("name_alias", 300),
-        ("description", 500),
-    )
-    display_attrs: tuple = (
-        "name",
-        "name_alias",
-        "description",
+    fields: tuple = _COMMON_FIELDS
+    display_attrs: tuple = _COMMON_DISPLAY_ATTRS + (
         "aci_app_profile",
         "aci_bridge_domain",
         "nb_tenant",
@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from django.test import TestCase
+from ipam.models import IPAddress
+from tenancy.models import Tenant, TenantGroup
 
 from ..forms.tenant_app_profiles import ACIAppProfileForm, ACIEndpointGroupForm
 from ..forms.tenant_networks import (
@@ -11,6 +13,24 @@ from ..forms.tenant_networks import (
     ACIVRFForm,
 )
 from ..forms.tenants import ACITenantForm
+from ..models.tenant_networks import (
+    ACIVRF,
+    ACIBridgeDomain,
+    ACIBridgeDomainSubnet,
+)
+from ..models.tenants import ACITenant
+
+
+class _ACIFormTestCase(TestCase):
+    """Base test case for ACI forms."""
+
+    def assertAllFieldsInFieldsets(self, form) -> None:
+        """Assert all form fields except comments are in a fieldset."""
+        fieldset_fields = [
+            field for fieldset in form.fieldsets for field in fieldset.items
+        ]
+        form_fields = [field for field in form.fields if field != "comments"]
+        self.assertCountEqual(fieldset_fields, form_fields)
 
 
 class ACITenantFormTestCase(TestCase):
@@ -106,7 +126,7 @@ class ACIAppProfileFormTestCase(TestCase):
         self.assertEqual(aci_app_profile_form.errors.get("description"), None)
 
 
-class ACIVRFFormTestCase(TestCase):
+class ACIVRFFormTestCase(_ACIFormTestCase):
     """Test case for ACIVRF form."""
 
     name_error_message: str = (
@@ -118,6 +138,33 @@ class ACIVRFFormTestCase(TestCase):
         allowed."
     )
 
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up ACI VRFs with and without a NetBox Tenant for testing."""
+        cls.nb_tenant_group = TenantGroup.objects.create(
+            name="NetBox Tenant Group 1", slug="netbox-tenant-group-1"
+        )
+        cls.nb_tenant_group_other = TenantGroup.objects.create(
+            name="NetBox Tenant Group 2", slug="netbox-tenant-group-2"
+        )
+        nb_tenant = Tenant.objects.create(
+            name="NetBox Tenant",
+            slug="netbox-tenant",
+            group=cls.nb_tenant_group,
+        )
+        cls.nb_tenant_other = Tenant.objects.create(
+            name="NetBox Tenant Other",
+            slug="netbox-tenant-other",
+            group=cls.nb_tenant_group_other,
+        )
+        aci_tenant = ACITenant.objects.create(name="ACITestTenant1")
+        cls.aci_vrf = ACIVRF.objects.create(
+            name="VRFTest1", aci_tenant=aci_tenant, nb_tenant=nb_tenant
+        )
+        cls.aci_vrf_no_nb_tenant = ACIVRF.objects.create(
+            name="VRFTest2", aci_tenant=aci_tenant
+        )
+
     def test_invalid_aci_vrf_field_values(self) -> None:
         """Test validation of invalid ACI VRF field values."""
         aci_vrf_form = ACIVRFForm(
@@ -151,8 +198,51 @@ class ACIVRFFormTestCase(TestCase):
         self.assertEqual(aci_vrf_form.errors.get("name_alias"), None)
         self.assertEqual(aci_vrf_form.errors.get("description"), None)
 
+    def test_aci_vrf_form_initial_nb_tenant_group(self) -> None:
+        """Test initial NetBox Tenant Group is set from the NetBox Tenant."""
+        aci_vrf_form = ACIVRFForm(instance=self.aci_vrf)
+        self.assertEqual(
+            aci_vrf_form.fields["nb_tenant_group"].initial,
+            self.aci_vrf.nb_tenant.group_id,
+        )
+
+    def test_aci_vrf_form_initial_nb_tenant_group_without_tenant(
+        self,
+    ) -> None:
+        """Test no initial NetBox Tenant Group is set without a Tenant."""
+        aci_vrf_form = ACIVRFForm(instance=self.aci_vrf_no_nb_tenant)
+        self.assertIsNone(aci_vrf_form.fields["nb_tenant_group"].initial)
+
+    def test_aci_vrf_form_passed_initial_nb_tenant_group(self) -> None:
+        """Test passed initial NetBox Tenant Group takes precedence."""
+        aci_vrf_form = ACIVRFForm(
+            instance=self.aci_vrf,
+            initial={"nb_tenant_group": self.nb_tenant_group_other.pk},
+        )
+        self.assertIsNone(aci_vrf_form.fields["nb_tenant_group"].initial)
+        self.assertEqual(
+            aci_vrf_form["nb_tenant_group"].initial,
+            self.nb_tenant_group_other.pk,
+        )
+
+    def test_aci_vrf_form_passed_initial_nb_tenant(self) -> None:
+        """Test passed initial NetBox Tenant skips the instance's group."""
+        aci_vrf_form = ACIVRFForm(
+            instance=self.aci_vrf,
+            initial={"nb_tenant": str(self.nb_tenant_other.pk)},
+        )
+        self.assertIsNone(aci_vrf_form.fields["nb_tenant_group"].initial)
+        self.assertEqual(
+            aci_vrf_form["nb_tenant_group"].initial,
+            self.nb_tenant_group_other,
+        )
+
+    def test_aci_vrf_form_fieldsets(self) -> None:
+        """Test all ACI VRF form fields are placed in a fieldset."""
+        self.assertAllFieldsInFieldsets(ACIVRFForm())
+
 
-class ACIBridgeDomainFormTestCase(TestCase):
+class ACIBridgeDomainFormTestCase(_ACIFormTestCase):
     """Test case for ACIBridgeDomain form."""
 
     name_error_message: str = (
@@ -164,6 +254,21 @@ class ACIBridgeDomainFormTestCase(TestCase):
         allowed."
     )
 
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an ACI Bridge Domain for testing."""
+        cls.aci_tenant = ACITenant.objects.create(name="ACITestTenant1")
+        cls.aci_tenant_other = ACITenant.objects.create(name="ACITestTenant2")
+        aci_vrf = ACIVRF.objects.create(
+            name="VRFTest1", aci_tenant=cls.aci_tenant
+        )
+        cls.aci_vrf_other = ACIVRF.objects.create(
+            name="VRFTest2", aci_tenant=cls.aci_tenant_other
+        )
+        cls.aci_bd = ACIBridgeDomain.objects.create(
+            name="BDTest1", aci_vrf=aci_vrf
+        )
+
     def test_invalid_aci_bridge_domain_field_values(self) -> None:
         """Test validation of invalid ACI Bridge Domain field values."""
         aci_bd_form = ACIBridgeDomainForm(
@@ -195,8 +300,41 @@ class ACIBridgeDomainFormTestCase(TestCase):
         self.assertEqual(aci_bd_form.errors.get("name_alias"), None)
         self.assertEqual(aci_bd_form.errors.get("description"), None)
 
+    def test_aci_bridge_domain_form_initial_aci_tenant(self) -> None:
+        """Test initial ACI Tenant is set from the ACI Bridge Domain."""
+        aci_bd_form = ACIBridgeDomainForm(instance=self.aci_bd)
+        self.assertEqual(
+            aci_bd_form.fields["aci_tenant"].initial, self.aci_tenant.pk
+        )
 
-class ACIBridgeDomainSubnetFormTestCase(TestCase):
+    def test_aci_bridge_domain_form_passed_initial_aci_tenant(self) -> None:
+        """Test passed initial ACI Tenant takes precedence over instance."""
+        aci_bd_form = ACIBridgeDomainForm(
+            instance=self.aci_bd,
+            initial={"aci_tenant": self.aci_tenant_other.pk},
+        )
+        self.assertIsNone(aci_bd_form.fields["aci_tenant"].initial)
+        self.assertEqual(
+            aci_bd_form["aci_tenant"].initial, self.aci_tenant_other.pk
+        )
+
+    def test_aci_bridge_domain_form_passed_initial_aci_vrf(self) -> None:
+        """Test passed initial ACI VRF skips the instance's ACI Tenant."""
+        aci_bd_form = ACIBridgeDomainForm(
+            instance=self.aci_bd,
+            initial={"aci_vrf": str(self.aci_vrf_other.pk)},
+        )
+        self.assertIsNone(aci_bd_form.fields["aci_tenant"].initial)
+        self.assertEqual(
+            aci_bd_form["aci_tenant"].initial, self.aci_tenant_other
+        )
+
+    def test_aci_bridge_domain_form_fieldsets(self) -> None:
+        """Test all ACI Bridge Domain form fields are placed in a fieldset."""
+        self.assertAllFieldsInFieldsets(ACIBridgeDomainForm())
+
+
+class ACIBridgeDomainSubnetFormTestCase(_ACIFormTestCase):
     """Test case for ACIBridgeDomainSubnet form."""
 
     name_error_message: str = (
@@ -208,6 +346,27 @@ class ACIBridgeDomainSubnetFormTestCase(TestCase):
         allowed."
     )
 
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up an ACI Bridge Domain Subnet for testing."""
+        cls.aci_tenant = ACITenant.objects.create(name="ACITestTenant1")
+        cls.aci_tenant_other = ACITenant.objects.create(name="ACITestTenant2")
+        cls.aci_vrf = ACIVRF.objects.create(
+            name="VRFTest1", aci_tenant=cls.aci_tenant
+        )
+        cls.aci_vrf_other = ACIVRF.objects.create(
+            name="VRFTest2", aci_tenant=cls.aci_tenant_other
+        )
+        aci_bd = ACIBridgeDomain.objects.create(
+            name="BDTest1", aci_vrf=cls.aci_vrf
+        )
+        gateway_ip = IPAddress.objects.create(address="10.0.0.1/24")
+        cls.aci_bd_subnet = ACIBridgeDomainSubnet.objects.create(
+            name="BDSubnetTest1",
+            aci_bridge_domain=aci_bd,
+            gateway_ip_address=gateway_ip,
+        )
+
     def test_invalid_aci_bridge_domain_subnet_field_values(self) -> None:
         """Test validation of invalid ACI Bridge Domain Subnet field values."""
         aci_bd_subnet_form = ACIBridgeDomainSubnetForm(
@@ -241,6 +400,49 @@ class ACIBridgeDomainSubnetFormTestCase(TestCase):
         self.assertEqual(aci_bd_subnet_form.errors.get("name_alias"), None)
         self.assertEqual(aci_bd_subnet_form.errors.get("description"), None)
 
+    def test_aci_bridge_domain_subnet_form_initial_parents(self) -> None:
+        """Test initial ACI VRF and Tenant are set from the ACI BD Subnet."""
+        aci_bd_subnet_form = ACIBridgeDomainSubnetForm(
+            instance=self.aci_bd_subnet
+        )
+        self.assertEqual(
+            aci_bd_subnet_form.fields["aci_vrf"].initial, self.aci_vrf.pk
+        )
+        self.assertEqual(
+            aci_bd_subnet_form.fields["aci_tenant"].initial,
+            self.aci_tenant.pk,
+        )
+
+    def test_aci_bridge_domain_subnet_form_passed_initial_parents(
+        self,
+    ) -> None:
+        """Test passed initial ACI VRF takes precedence over instance."""
+        aci_bd_subnet_form = ACIBridgeDomainSubnetForm(
+            instance=self.aci_bd_subnet,
+            initial={"aci_vrf": self.aci_vrf_other.pk},
+        )
+        self.assertIsNone(aci_bd_subnet_form.fields["aci_vrf"].initial)
+        self.assertEqual(
+            aci_bd_subnet_form["aci_vrf"].initial, self.aci_vrf_other.pk
+        )
+        self.assertIsNone(aci_bd_subnet_form.fields["aci_tenant"].initial)
+        self.assertEqual(
+            aci_bd_subnet_form["aci_tenant"].initial, self.aci_tenant_other
+        )
+
+    def test_gateway_ip_address_query_params(self) -> None:
+        """Test the gateway IP address is filtered by the selected VRF."""
+        aci_bd_subnet_form = ACIBridgeDomainSubnetForm()
+        gateway_ip_field = aci_bd_subnet_form.fields["gateway_ip_address"]
+        self.assertEqual(
+            gateway_ip_field.query_params, {"present_in_vrf_id": "$nb_vrf"}
+        )
+        self.assertIn("nb_vrf", aci_bd_subnet_form.fields)
+
+    def test_aci_bridge_domain_subnet_form_fieldsets(self) -> None:
+        """Test all ACI BD Subnet form fields are placed in a fieldset."""
+        self.assertAllFieldsInFieldsets(ACIBridgeDomainSubnetForm())
+
 
 class ACIEndpointGroupFormTestCase(TestCase):
     """Test case for ACIEndpointGroup form."""
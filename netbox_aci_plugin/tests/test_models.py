@@ -4,7 +4,7 @@
 
 from django.core.exceptions import ValidationError
 from django.db.utils import IntegrityError
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from ipam.models import VRF, IPAddress
 from tenancy.models import Tenant
 
@@ -25,27 +25,51 @@ from ..models.tenant_networks import (
 from ..models.tenants import ACITenant
 
 
+def _fields_except(model, field_name: str) -> list:
+    """Return the names of all model fields except the given field."""
+    return [
+        field.name for field in model._meta.fields if field.name != field_name
+    ]
+
+
+class _ACITenantFixturesTestCase(TestCase):
+    """Base test case providing a NetBox Tenant and an ACI Tenant."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Set up the NetBox Tenant and ACI Tenant shared by the test cases."""
+        cls.nb_tenant = Tenant.objects.create(name="NetBox Tenant")
+        cls.aci_tenant = ACITenant.objects.create(name="ACITestTenant1")
+
+    def assertAttributeValues(self, obj, expected_values: tuple) -> None:
+        """Assert the object attributes have the expected values."""
+        for attr, expected in expected_values:
+            with self.subTest(attr=attr):
+                self.assertEqual(getattr(obj, attr), expected)
+
+
 class ACITenantTestCase(TestCase):
     """Test case for ACITenant model."""
 
-    def setUp(self) -> None:
+    comments: str = """
+    Tenant for NetBox ACI Plugin testing.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
         """Set up an ACI Tenant for testing."""
         acitenant_name = "ACITestTenant1"
         acitenant_name_alias = "TestingTenant"
         acitenant_description = "Tenant for NetBox ACI Plugin testing"
-        acitenant_comments = """
-        Tenant for NetBox ACI Plugin testing.
-        """
         nb_tenant = Tenant.objects.create(name="NetBox Tenant")
 
-        self.aci_tenant = ACITenant.objects.create(
+        cls.aci_tenant = ACITenant.objects.create(
             name=acitenant_name,
             name_alias=acitenant_name_alias,
             description=acitenant_description,
-            comments=acitenant_comments,
+            comments=cls.comments,
             nb_tenant=nb_tenant,
         )
-        super().setUp()
 
     def test_create_aci_tenant(self) -> None:
         """Test type and values of created ACI Tenant."""
@@ -58,53 +82,69 @@ class ACITenantTestCase(TestCase):
         self.assertTrue(isinstance(self.aci_tenant.nb_tenant, Tenant))
         self.assertEqual(self.aci_tenant.nb_tenant.name, "NetBox Tenant")
 
+    def test_constraint_unique_aci_tenant_name(self) -> None:
+        """Test unique constraint of ACI Tenant name."""
+        tenant = ACITenant(name="ACITestTenant1")
+        self.assertRaises(IntegrityError, tenant.save)
+
+
+class ACITenantValidationTestCase(SimpleTestCase):
+    """Test case for ACITenant model field validation."""
+
     def test_invalid_aci_tenant_name(self) -> None:
         """Test validation of ACI Tenant naming."""
         tenant = ACITenant(name="ACI Test Tenant 1")
-        self.assertRaises(ValidationError, tenant.full_clean)
+        self.assertRaises(
+            ValidationError,
+            tenant.clean_fields,
+            exclude=_fields_except(ACITenant, "name"),
+        )
 
     def test_invalid_aci_tenant_name_alias(self) -> None:
         """Test validation of ACI Tenant aliasing."""
         tenant = ACITenant(name="ACITestTenant1", name_alias="Invalid Alias")
-        self.assertRaises(ValidationError, tenant.full_clean)
+        self.assertRaises(
+            ValidationError,
+            tenant.clean_fields,
+            exclude=_fields_except(ACITenant, "name_alias"),
+        )
 
     def test_invalid_aci_tenant_description(self) -> None:
         """Test validation of ACI Tenant description."""
         tenant = ACITenant(
             name="ACITestTenant1", description="Invalid Description: ö"
         )
-        self.assertRaises(ValidationError, tenant.full_clean)
-
-    def test_constraint_unique_aci_tenant_name(self) -> None:
-        """Test unique constraint of ACI Tenant name."""
-        tenant = ACITenant(name="ACITestTenant1")
-        self.assertRaises(IntegrityError, tenant.save)
+        self.assertRaises(
+            ValidationError,
+            tenant.clean_fields,
+            exclude=_fields_except(ACITenant, "description"),
+        )
 
 
-class ACIAppProfileTestCase(TestCase):
+class ACIAppProfileTestCase(_ACITenantFixturesTestCase):
     """Test case for ACIAppProfile model."""
 
-    def setUp(self) -> None:
+    comments: str = """
+    AppProfile for NetBox ACI Plugin testing.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
         """Set up an ACI AppProfile for testing."""
-        acitenant_name = "ACITestTenant1"
+        super().setUpTestData()
+
         aciappprofile_name = "AppProfileTest1"
         aciappprofile_name_alias = "TestingAppProfile"
         aciappprofile_description = "AppProfile for NetBox ACI Plugin testing"
-        aciappprofile_comments = """
-        AppProfile for NetBox ACI Plugin testing.
-        """
-        aci_tenant = ACITenant.objects.create(name=acitenant_name)
-        nb_tenant = Tenant.objects.create(name="NetBox Tenant")
 
-        self.aci_app_profile = ACIAppProfile.objects.create(
+        cls.aci_app_profile = ACIAppProfile.objects.create(
             name=aciappprofile_name,
             name_alias=aciappprofile_name_alias,
             description=aciappprofile_description,
-            comments=aciappprofile_comments,
-            aci_tenant=aci_tenant,
-            nb_tenant=nb_tenant,
+            comments=cls.comments,
+            aci_tenant=cls.aci_tenant,
+            nb_tenant=cls.nb_tenant,
         )
-        super().setUp()
 
     def test_create_aci_app_profile(self) -> None:
         """Test type and values of created ACI Application Profile."""
@@ -112,58 +152,78 @@ class ACIAppProfileTestCase(TestCase):
         self.assertEqual(
             self.aci_app_profile.__str__(), self.aci_app_profile.name
         )
-        self.assertEqual(self.aci_app_profile.name_alias, "TestingAppProfile")
-        self.assertEqual(
-            self.aci_app_profile.description,
-            "AppProfile for NetBox ACI Plugin testing",
-        )
         self.assertTrue(isinstance(self.aci_app_profile.aci_tenant, ACITenant))
         self.assertEqual(
             self.aci_app_profile.aci_tenant.name, "ACITestTenant1"
         )
         self.assertTrue(isinstance(self.aci_app_profile.nb_tenant, Tenant))
         self.assertEqual(self.aci_app_profile.nb_tenant.name, "NetBox Tenant")
+        expected_values: tuple = (
+            ("name_alias", "TestingAppProfile"),
+            ("description", "AppProfile for NetBox ACI Plugin testing"),
+        )
+        self.assertAttributeValues(self.aci_app_profile, expected_values)
+
+    def test_constraint_unique_aci_app_profile_name_per_aci_tenant(
+        self,
+    ) -> None:
+        """Test unique constraint of ACI AppProfile name per ACI Tenant."""
+        app_profile = ACIAppProfile(
+            name="AppProfileTest1", aci_tenant=self.aci_tenant
+        )
+        self.assertRaises(IntegrityError, app_profile.save)
+
+
+class ACIAppProfileValidationTestCase(SimpleTestCase):
+    """Test case for ACIAppProfile model field validation."""
 
     def test_invalid_aci_app_profile_name(self) -> None:
         """Test validation of ACI AppProfile naming."""
         app_profile = ACIAppProfile(name="ACI App Profile Test 1")
-        self.assertRaises(ValidationError, app_profile.full_clean)
+        self.assertRaises(
+            ValidationError,
+            app_profile.clean_fields,
+            exclude=_fields_except(ACIAppProfile, "name"),
+        )
 
     def test_invalid_aci_app_profile_name_alias(self) -> None:
         """Test validation of ACI AppProfile aliasing."""
         app_profile = ACIAppProfile(
             name="ACIAppProfileTest1", name_alias="Invalid Alias"
         )
-        self.assertRaises(ValidationError, app_profile.full_clean)
+        self.assertRaises(
+            ValidationError,
+            app_profile.clean_fields,
+            exclude=_fields_except(ACIAppProfile, "name_alias"),
+        )
 
     def test_invalid_aci_app_profile_description(self) -> None:
         """Test validation of ACI AppProfile description."""
         app_profile = ACIAppProfile(
             name="ACIAppProfileTest1", description="Invalid Description: ö"
         )
-        self.assertRaises(ValidationError, app_profile.full_clean)
-
-    def test_constraint_unique_aci_app_profile_name_per_aci_tenant(
-        self,
-    ) -> None:
-        """Test unique constraint of ACI AppProfile name per ACI Tenant."""
-        tenant = ACITenant.objects.get(name="ACITestTenant1")
-        app_profile = ACIAppProfile(name="AppProfileTest1", aci_tenant=tenant)
-        self.assertRaises(IntegrityError, app_profile.save)
+        self.assertRaises(
+            ValidationError,
+            app_profile.clean_fields,
+            exclude=_fields_except(ACIAppProfile, "description"),
+        )
 
 
-class ACIVRFTestCase(TestCase):
+class ACIVRFTestCase(_ACITenantFixturesTestCase):
     """Test case for ACIVRF model."""
 
-    def setUp(self) -> None:
+    comments: str = """
+    VRF for NetBox ACI Plugin testing.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
         """Set up an ACI VRF for testing."""
-        acitenant_name = "ACITestTenant1"
+        super().setUpTestData()
+
         acivrf_name = "VRFTest1"
         acivrf_name_alias = "TestingVRF"
         acivrf_description = "VRF for NetBox ACI Plugin testing"
-        acivrf_comments = """
-        VRF for NetBox ACI Plugin testing.
-        """
         acivrf_bd_enforcement_enabled = False
         acivrf_dns_labels = ["DNS1", "DNS2"]
         acivrf_ip_dp_learning_enabled = False
@@ -176,17 +236,15 @@ class ACIVRFTestCase(TestCase):
         acivrf_pim_ipv4_enabled = False
         acivrf_pim_ipv6_enabled = False
         acivrf_preferred_group_enabled = True
-        aci_tenant = ACITenant.objects.create(name=acitenant_name)
-        nb_tenant = Tenant.objects.create(name="NetBox Tenant")
-        nb_vrf = VRF.objects.create(name="NetBox-VRF", tenant=nb_tenant)
+        nb_vrf = VRF.objects.create(name="NetBox-VRF", tenant=cls.nb_tenant)
 
-        self.aci_vrf = ACIVRF.objects.create(
+        cls.aci_vrf = ACIVRF.objects.create(
             name=acivrf_name,
             name_alias=acivrf_name_alias,
             description=acivrf_description,
-            comments=acivrf_comments,
-            aci_tenant=aci_tenant,
-            nb_tenant=nb_tenant,
+            comments=cls.comments,
+            aci_tenant=cls.aci_tenant,
+            nb_tenant=cls.nb_tenant,
             nb_vrf=nb_vrf,
             bd_enforcement_enabled=acivrf_bd_enforcement_enabled,
             dns_labels=acivrf_dns_labels,
@@ -197,66 +255,84 @@ class ACIVRFTestCase(TestCase):
             pim_ipv6_enabled=acivrf_pim_ipv6_enabled,
             preferred_group_enabled=acivrf_preferred_group_enabled,
         )
-        super().setUp()
 
     def test_create_aci_vrf(self) -> None:
         """Test type and values of created ACI VRF."""
         self.assertTrue(isinstance(self.aci_vrf, ACIVRF))
         self.assertEqual(self.aci_vrf.__str__(), self.aci_vrf.name)
-        self.assertEqual(self.aci_vrf.name_alias, "TestingVRF")
-        self.assertEqual(
-            self.aci_vrf.description, "VRF for NetBox ACI Plugin testing"
-        )
         self.assertTrue(isinstance(self.aci_vrf.aci_tenant, ACITenant))
         self.assertEqual(self.aci_vrf.aci_tenant.name, "ACITestTenant1")
         self.assertTrue(isinstance(self.aci_vrf.nb_tenant, Tenant))
         self.assertEqual(self.aci_vrf.nb_tenant.name, "NetBox Tenant")
         self.assertTrue(isinstance(self.aci_vrf.nb_vrf, VRF))
         self.assertEqual(self.aci_vrf.nb_vrf.name, "NetBox-VRF")
-        self.assertEqual(self.aci_vrf.bd_enforcement_enabled, False)
-        self.assertEqual(self.aci_vrf.dns_labels, ["DNS1", "DNS2"])
-        self.assertEqual(self.aci_vrf.ip_data_plane_learning_enabled, False)
-        self.assertEqual(self.aci_vrf.pc_enforcement_direction, "egress")
-        self.assertEqual(self.aci_vrf.pc_enforcement_preference, "unenforced")
-        self.assertEqual(self.aci_vrf.pim_ipv4_enabled, False)
-        self.assertEqual(self.aci_vrf.pim_ipv6_enabled, False)
-        self.assertEqual(self.aci_vrf.preferred_group_enabled, True)
+        expected_values: tuple = (
+            ("name_alias", "TestingVRF"),
+            ("description", "VRF for NetBox ACI Plugin testing"),
+            ("bd_enforcement_enabled", False),
+            ("dns_labels", ["DNS1", "DNS2"]),
+            ("ip_data_plane_learning_enabled", False),
+            ("pc_enforcement_direction", "egress"),
+            ("pc_enforcement_preference", "unenforced"),
+            ("pim_ipv4_enabled", False),
+            ("pim_ipv6_enabled", False),
+            ("preferred_group_enabled", True),
+        )
+        self.assertAttributeValues(self.aci_vrf, expected_values)
+
+    def test_constraint_unique_aci_vrf_name_per_aci_tenant(self) -> None:
+        """Test unique constraint of ACI VRF name per ACI Tenant."""
+        vrf = ACIVRF(name="VRFTest1", aci_tenant=self.aci_tenant)
+        self.assertRaises(IntegrityError, vrf.save)
+
+
+class ACIVRFValidationTestCase(SimpleTestCase):
+    """Test case for ACIVRF model field validation."""
 
     def test_invalid_aci_vrf_name(self) -> None:
         """Test validation of ACI VRF naming."""
         vrf = ACIVRF(name="ACI VRF Test 1")
-        self.assertRaises(ValidationError, vrf.full_clean)
+        self.assertRaises(
+            ValidationError,
+            vrf.clean_fields,
+            exclude=_fields_except(ACIVRF, "name"),
+        )
 
     def test_invalid_aci_vrf_name_alias(self) -> None:
         """Test validation of ACI VRF aliasing."""
         vrf = ACIVRF(name="ACIVRFTest1", name_alias="Invalid Alias")
-        self.assertRaises(ValidationError, vrf.full_clean)
+        self.assertRaises(
+            ValidationError,
+            vrf.clean_fields,
+            exclude=_fields_except(ACIVRF, "name_alias"),
+        )
 
     def test_invalid_aci_vrf_description(self) -> None:
         """Test validation of ACI VRF description."""
         vrf = ACIVRF(name="ACIVRFTest1", description="Invalid Description: ö")
-        self.assertRaises(ValidationError, vrf.full_clean)
-
-    def test_constraint_unique_aci_vrf_name_per_aci_tenant(self) -> None:
-        """Test unique constraint of ACI VRF name per ACI Tenant."""
-        tenant = ACITenant.objects.get(name="ACITestTenant1")
-        vrf = ACIVRF(name="VRFTest1", aci_tenant=tenant)
-        self.assertRaises(IntegrityError, vrf.save)
+        self.assertRaises(
+            ValidationError,
+            vrf.clean_fields,
+            exclude=_fields_except(ACIVRF, "description"),
+        )
 
 
-class ACIBridgeDomainTestCase(TestCase):
+class ACIBridgeDomainTestCase(_ACITenantFixturesTestCase):
     """Test case for ACIBridgeDomain model."""
 
-    def setUp(self) -> None:
+    comments: str = """
+    BD for NetBox ACI Plugin testing.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
         """Set up an ACI Bridge Domain for testing."""
-        acitenant_name = "ACITestTenant1"
+        super().setUpTestData()
+
         acivrf_name = "VRFTest1"
         acibd_name = "BDTest1"
         acibd_name_alias = "TestingBD"
         acibd_description = "BD for NetBox ACI Plugin testing"
-        acibd_comments = """
-        BD for NetBox ACI Plugin testing.
-        """
         acibd_advertise_host_routes_enabled = False
         acibd_arp_flooding_enabled = True
         acibd_clear_remote_mac_enabled = True
@@ -284,19 +360,17 @@ class ACIBridgeDomainTestCase(TestCase):
         acibd_unknown_unicast = BDUnknownUnicastChoices.UNKNOWN_UNI_PROXY
         acibd_virtual_mac_address = "00:11:22:33:44:55"
 
-        aci_tenant = ACITenant.objects.create(name=acitenant_name)
         aci_vrf = ACIVRF.objects.create(
-            name=acivrf_name, aci_tenant=aci_tenant
+            name=acivrf_name, aci_tenant=cls.aci_tenant
         )
-        nb_tenant = Tenant.objects.create(name="NetBox Tenant")
 
-        self.aci_bd = ACIBridgeDomain.objects.create(
+        cls.aci_bd = ACIBridgeDomain.objects.create(
             name=acibd_name,
             name_alias=acibd_name_alias,
             description=acibd_description,
-            comments=acibd_comments,
+            comments=cls.comments,
             aci_vrf=aci_vrf,
-            nb_tenant=nb_tenant,
+            nb_tenant=cls.nb_tenant,
             advertise_host_routes_enabled=acibd_advertise_host_routes_enabled,
             arp_flooding_enabled=acibd_arp_flooding_enabled,
             clear_remote_mac_enabled=acibd_clear_remote_mac_enabled,
@@ -318,91 +392,102 @@ class ACIBridgeDomainTestCase(TestCase):
             unknown_unicast=acibd_unknown_unicast,
             virtual_mac_address=acibd_virtual_mac_address,
         )
-        super().setUp()
 
     def test_create_aci_bridge_domain(self) -> None:
         """Test type and values of created ACI Bridge Domain."""
         self.assertTrue(isinstance(self.aci_bd, ACIBridgeDomain))
         self.assertEqual(self.aci_bd.__str__(), self.aci_bd.name)
-        self.assertEqual(self.aci_bd.name_alias, "TestingBD")
-        self.assertEqual(
-            self.aci_bd.description, "BD for NetBox ACI Plugin testing"
-        )
         self.assertTrue(isinstance(self.aci_bd.aci_tenant, ACITenant))
         self.assertEqual(self.aci_bd.aci_tenant.name, "ACITestTenant1")
         self.assertTrue(isinstance(self.aci_bd.aci_vrf, ACIVRF))
         self.assertEqual(self.aci_bd.aci_vrf.name, "VRFTest1")
         self.assertTrue(isinstance(self.aci_bd.nb_tenant, Tenant))
         self.assertEqual(self.aci_bd.nb_tenant.name, "NetBox Tenant")
-        self.assertEqual(self.aci_bd.advertise_host_routes_enabled, False)
-        self.assertEqual(self.aci_bd.arp_flooding_enabled, True)
-        self.assertEqual(self.aci_bd.clear_remote_mac_enabled, True)
-        self.assertEqual(self.aci_bd.dhcp_labels, ["DHCP1", "DHCP2"])
-        self.assertEqual(self.aci_bd.ep_move_detection_enabled, True)
-        self.assertEqual(
-            self.aci_bd.igmp_interface_policy_name, "IGMPInterfacePolicy1"
-        )
-        self.assertEqual(
-            self.aci_bd.igmp_snooping_policy_name, "IGMPSnoopingPolicy1"
-        )
-        self.assertEqual(self.aci_bd.ip_data_plane_learning_enabled, True)
-        self.assertEqual(self.aci_bd.limit_ip_learn_enabled, True)
-        self.assertEqual(self.aci_bd.mac_address, "00:11:22:33:44:55")
-        self.assertEqual(self.aci_bd.multi_destination_flooding, "bd-flood")
-        self.assertEqual(self.aci_bd.pim_ipv4_enabled, False)
-        self.assertEqual(
-            self.aci_bd.pim_ipv4_destination_filter, "PIMDestinationFilter1"
-        )
-        self.assertEqual(
-            self.aci_bd.pim_ipv4_source_filter, "PIMSourceFilter1"
-        )
-        self.assertEqual(self.aci_bd.pim_ipv6_enabled, False)
-        self.assertEqual(self.aci_bd.unicast_routing_enabled, True)
-        self.assertEqual(self.aci_bd.unknown_ipv4_multicast, "flood")
-        self.assertEqual(self.aci_bd.unknown_ipv6_multicast, "flood")
-        self.assertEqual(self.aci_bd.unknown_unicast, "proxy")
-        self.assertEqual(self.aci_bd.virtual_mac_address, "00:11:22:33:44:55")
+        expected_values: tuple = (
+            ("name_alias", "TestingBD"),
+            ("description", "BD for NetBox ACI Plugin testing"),
+            ("advertise_host_routes_enabled", False),
+            ("arp_flooding_enabled", True),
+            ("clear_remote_mac_enabled", True),
+            ("dhcp_labels", ["DHCP1", "DHCP2"]),
+            ("ep_move_detection_enabled", True),
+            ("igmp_interface_policy_name", "IGMPInterfacePolicy1"),
+            ("igmp_snooping_policy_name", "IGMPSnoopingPolicy1"),
+            ("ip_data_plane_learning_enabled", True),
+            ("limit_ip_learn_enabled", True),
+            ("mac_address", "00:11:22:33:44:55"),
+            ("multi_destination_flooding", "bd-flood"),
+            ("pim_ipv4_enabled", False),
+            ("pim_ipv4_destination_filter", "PIMDestinationFilter1"),
+            ("pim_ipv4_source_filter", "PIMSourceFilter1"),
+            ("pim_ipv6_enabled", False),
+            ("unicast_routing_enabled", True),
+            ("unknown_ipv4_multicast", "flood"),
+            ("unknown_ipv6_multicast", "flood"),
+            ("unknown_unicast", "proxy"),
+            ("virtual_mac_address", "00:11:22:33:44:55"),
+        )
+        self.assertAttributeValues(self.aci_bd, expected_values)
+
+    def test_constraint_unique_aci_bridge_domain_name_per_aci_vrf(
+        self,
+    ) -> None:
+        """Test unique constraint of ACI Bridge Domain name per ACI VRF."""
+        vrf = ACIVRF.objects.get(name="VRFTest1")
+        bd = ACIBridgeDomain(name="BDTest1", aci_vrf=vrf)
+        self.assertRaises(IntegrityError, bd.save)
+
+
+class ACIBridgeDomainValidationTestCase(SimpleTestCase):
+    """Test case for ACIBridgeDomain model field validation."""
 
     def test_invalid_aci_bridge_domain_name(self) -> None:
         """Test validation of ACI Bridge Domain naming."""
         bd = ACIBridgeDomain(name="ACI BD Test 1")
-        self.assertRaises(ValidationError, bd.full_clean)
+        self.assertRaises(
+            ValidationError,
+            bd.clean_fields,
+            exclude=_fields_except(ACIBridgeDomain, "name"),
+        )
 
     def test_invalid_aci_bridge_domain_name_alias(self) -> None:
         """Test validation of ACI Bridge Domain aliasing."""
         bd = ACIBridgeDomain(name="ACIBDTest1", name_alias="Invalid Alias")
-        self.assertRaises(ValidationError, bd.full_clean)
+        self.assertRaises(
+            ValidationError,
+            bd.clean_fields,
+            exclude=_fields_except(ACIBridgeDomain, "name_alias"),
+        )
 
     def test_invalid_aci_bridge_domain_description(self) -> None:
         """Test validation of ACI Bridge Domain description."""
         bd = ACIBridgeDomain(
             name="ACIBDTest1", description="Invalid Description: ö"
         )
-        self.assertRaises(ValidationError, bd.full_clean)
-
-    def test_constraint_unique_aci_bridge_domain_name_per_aci_vrf(
-        self,
-    ) -> None:
-        """Test unique constraint of ACI Bridge Domain name per ACI VRF."""
-        vrf = ACIVRF.objects.get(name="VRFTest1")
-        bd = ACIBridgeDomain(name="BDTest1", aci_vrf=vrf)
-        self.assertRaises(IntegrityError, bd.save)
+        self.assertRaises(
+            ValidationError,
+            bd.clean_fields,
+            exclude=_fields_except(ACIBridgeDomain, "description"),
+        )
 
 
-class ACIBridgeDomainSubnetTestCase(TestCase):
+class ACIBridgeDomainSubnetTestCase(_ACITenantFixturesTestCase):
     """Test case for ACIBridgeDomainSubnet model."""
 
-    def setUp(self) -> None:
+    comments: str = """
+    BDSubnet for NetBox ACI Plugin testing.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
         """Set up an ACI Bridge Domain Subnet for testing."""
-        acitenant_name = "ACITestTenant1"
+        super().setUpTestData()
+
         acivrf_name = "VRFTest1"
         acibd_name = "BDTest1"
         acisnet_name = "BDSubnetTest1"
         acisnet_name_alias = "TestingBDSubnet"
         acisnet_description = "BDSubnet for NetBox ACI Plugin testing"
-        acisnet_comments = """
-        BDSubnet for NetBox ACI Plugin testing.
-        """
         acisnet_gateway_ip_address = "10.0.0.1/24"
         acisnet_advertised_externally_enabled = False
         acisnet_igmp_querier_enabled = True
@@ -414,9 +499,8 @@ class ACIBridgeDomainSubnetTestCase(TestCase):
         acisnet_shared_enabled = False
         acisnet_virtual_ip_enabled = False
 
-        aci_tenant = ACITenant.objects.create(name=acitenant_name)
         aci_vrf = ACIVRF.objects.create(
-            name=acivrf_name, aci_tenant=aci_tenant
+            name=acivrf_name, aci_tenant=cls.aci_tenant
         )
         aci_bridge_domain = ACIBridgeDomain.objects.create(
             name=acibd_name, aci_vrf=aci_vrf
@@ -424,16 +508,15 @@ class ACIBridgeDomainSubnetTestCase(TestCase):
         aci_bd_gateway = IPAddress.objects.create(
             address=acisnet_gateway_ip_address
         )
-        nb_tenant = Tenant.objects.create(name="NetBox Tenant")
 
-        self.aci_bd_subnet = ACIBridgeDomainSubnet.objects.create(
+        cls.aci_bd_subnet = ACIBridgeDomainSubnet.objects.create(
             name=acisnet_name,
             name_alias=acisnet_name_alias,
             description=acisnet_description,
-            comments=acisnet_comments,
+            comments=cls.comments,
             aci_bridge_domain=aci_bridge_domain,
             gateway_ip_address=aci_bd_gateway,
-            nb_tenant=nb_tenant,
+            nb_tenant=cls.nb_tenant,
             advertised_externally_enabled=acisnet_advertised_externally_enabled,
             igmp_querier_enabled=acisnet_igmp_querier_enabled,
             ip_data_plane_learning_enabled=acisnet_ip_dp_learning_enabled,
@@ -444,17 +527,11 @@ class ACIBridgeDomainSubnetTestCase(TestCase):
             shared_enabled=acisnet_shared_enabled,
             virtual_ip_enabled=acisnet_virtual_ip_enabled,
         )
-        super().setUp()
 
     def test_create_aci_bridge_domain(self) -> None:
         """Test type and values of created ACI Bridge Domain."""
         self.assertTrue(isinstance(self.aci_bd_subnet, ACIBridgeDomainSubnet))
         self.assertEqual(self.aci_bd_subnet.__str__(), self.aci_bd_subnet.name)
-        self.assertEqual(self.aci_bd_subnet.name_alias, "TestingBDSubnet")
-        self.assertEqual(
-            self.aci_bd_subnet.description,
-            "BDSubnet for NetBox ACI Plugin testing",
-        )
         self.assertTrue(isinstance(self.aci_bd_subnet.aci_tenant, ACITenant))
         self.assertEqual(self.aci_bd_subnet.aci_tenant.name, "ACITestTenant1")
         self.assertTrue(isinstance(self.aci_bd_subnet.aci_vrf, ACIVRF))
@@ -471,40 +548,20 @@ class ACIBridgeDomainSubnetTestCase(TestCase):
         )
         self.assertTrue(isinstance(self.aci_bd_subnet.nb_tenant, Tenant))
         self.assertEqual(self.aci_bd_subnet.nb_tenant.name, "NetBox Tenant")
-        self.assertEqual(
-            self.aci_bd_subnet.advertised_externally_enabled, False
-        )
-        self.assertEqual(self.aci_bd_subnet.igmp_querier_enabled, True)
-        self.assertEqual(
-            self.aci_bd_subnet.ip_data_plane_learning_enabled, True
-        )
-        self.assertEqual(self.aci_bd_subnet.no_default_gateway, False)
-        self.assertEqual(self.aci_bd_subnet.nd_ra_enabled, True)
-        self.assertEqual(
-            self.aci_bd_subnet.nd_ra_prefix_policy_name, "NDRAPolicy1"
-        )
-        self.assertEqual(self.aci_bd_subnet.preferred_ip_address_enabled, True)
-        self.assertEqual(self.aci_bd_subnet.shared_enabled, False)
-        self.assertEqual(self.aci_bd_subnet.virtual_ip_enabled, False)
-
-    def test_invalid_aci_bridge_domain_subnet_name(self) -> None:
-        """Test validation of ACI Bridge Domain Subnet naming."""
-        subnet = ACIBridgeDomainSubnet(name="ACI BDSubnet Test 1")
-        self.assertRaises(ValidationError, subnet.full_clean)
-
-    def test_invalid_aci_bridge_domain_subnet_name_alias(self) -> None:
-        """Test validation of ACI Bridge Domain Subnet aliasing."""
-        subnet = ACIBridgeDomainSubnet(
-            name="ACIBDSubnetTest1", name_alias="Invalid Alias"
-        )
-        self.assertRaises(ValidationError, subnet.full_clean)
-
-    def test_invalid_aci_bridge_domain_subnet_description(self) -> None:
-        """Test validation of ACI Bridge Domain Subnet description."""
-        subnet = ACIBridgeDomainSubnet(
-            name="ACIBDSubnetTest1", description="Invalid Description: ö"
-        )
-        self.assertRaises(ValidationError, subnet.full_clean)
+        expected_values: tuple = (
+            ("name_alias", "TestingBDSubnet"),
+            ("description", "BDSubnet for NetBox ACI Plugin testing"),
+            ("advertised_externally_enabled", False),
+            ("igmp_querier_enabled", True),
+            ("ip_data_plane_learning_enabled", True),
+            ("no_default_gateway", False),
+            ("nd_ra_enabled", True),
+            ("nd_ra_prefix_policy_name", "NDRAPolicy1"),
+            ("preferred_ip_address_enabled", True),
+            ("shared_enabled", False),
+            ("virtual_ip_enabled", False),
+        )
+        self.assertAttributeValues(self.aci_bd_subnet, expected_values)
 
     def test_constraint_unique_aci_bd_subnet_name_per_aci_bridge_domain(
         self,
@@ -532,21 +589,59 @@ class ACIBridgeDomainSubnetTestCase(TestCase):
         self.assertRaises(IntegrityError, subnet.save)
 
 
-class ACIEndpointGroupTestCase(TestCase):
+class ACIBridgeDomainSubnetValidationTestCase(SimpleTestCase):
+    """Test case for ACIBridgeDomainSubnet model field validation."""
+
+    def test_invalid_aci_bridge_domain_subnet_name(self) -> None:
+        """Test validation of ACI Bridge Domain Subnet naming."""
+        subnet = ACIBridgeDomainSubnet(name="ACI BDSubnet Test 1")
+        self.assertRaises(
+            ValidationError,
+            subnet.clean_fields,
+            exclude=_fields_except(ACIBridgeDomainSubnet, "name"),
+        )
+
+    def test_invalid_aci_bridge_domain_subnet_name_alias(self) -> None:
+        """Test validation of ACI Bridge Domain Subnet aliasing."""
+        subnet = ACIBridgeDomainSubnet(
+            name="ACIBDSubnetTest1", name_alias="Invalid Alias"
+        )
+        self.assertRaises(
+            ValidationError,
+            subnet.clean_fields,
+            exclude=_fields_except(ACIBridgeDomainSubnet, "name_alias"),
+        )
+
+    def test_invalid_aci_bridge_domain_subnet_description(self) -> None:
+        """Test validation of ACI Bridge Domain Subnet description."""
+        subnet = ACIBridgeDomainSubnet(
+            name="ACIBDSubnetTest1", description="Invalid Description: ö"
+        )
+        self.assertRaises(
+            ValidationError,
+            subnet.clean_fields,
+            exclude=_fields_except(ACIBridgeDomainSubnet, "description"),
+        )
+
+
+class ACIEndpointGroupTestCase(_ACITenantFixturesTestCase):
     """Test case for ACIEndpointGroup model."""
 
-    def setUp(self) -> None:
+    comments: str = """
+    EPG for NetBox ACI Plugin testing.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
         """Set up an ACI Endpoint Group for testing."""
-        acitenant_name = "ACITestTenant1"
+        super().setUpTestData()
+
         aciappprofile_name = "AppProfileTest1"
         acivrf_name = "VRFTest1"
         acibd_name = "BDTest1"
         aciepg_name = "EPGTest1"
         aciepg_name_alias = "TestingEPG"
         aciepg_description = "EPG for NetBox ACI Plugin testing"
-        aciepg_comments = """
-        EPG for NetBox ACI Plugin testing.
-        """
         aciepg_admin_shutdown = False
         aciepg_custom_qos_policy_name = "CustomQoSPolicy1"
         aciepg_flood_in_encap_enabled = False
@@ -555,26 +650,24 @@ class ACIEndpointGroupTestCase(TestCase):
         aciepg_preferred_group_member_enabled = False
         aciepg_proxy_arp_enabled = False
 
-        aci_tenant = ACITenant.objects.create(name=acitenant_name)
         aci_app_profile = ACIAppProfile.objects.create(
-            name=aciappprofile_name, aci_tenant=aci_tenant
+            name=aciappprofile_name, aci_tenant=cls.aci_tenant
         )
         aci_vrf = ACIVRF.objects.create(
-            name=acivrf_name, aci_tenant=aci_tenant
+            name=acivrf_name, aci_tenant=cls.aci_tenant
         )
         aci_bd = ACIBridgeDomain.objects.create(
             name=acibd_name, aci_vrf=aci_vrf
         )
-        nb_tenant = Tenant.objects.create(name="NetBox Tenant")
 
-        self.aci_epg = ACIEndpointGroup.objects.create(
+        cls.aci_epg = ACIEndpointGroup.objects.create(
             name=aciepg_name,
             name_alias=aciepg_name_alias,
             description=aciepg_description,
-            comments=aciepg_comments,
+            comments=cls.comments,
             aci_app_profile=aci_app_profile,
             aci_bridge_domain=aci_bd,
-            nb_tenant=nb_tenant,
+            nb_tenant=cls.nb_tenant,
             admin_shutdown=aciepg_admin_shutdown,
             custom_qos_policy_name=aciepg_custom_qos_policy_name,
             flood_in_encap_enabled=aciepg_flood_in_encap_enabled,
@@ -583,16 +676,11 @@ class ACIEndpointGroupTestCase(TestCase):
             preferred_group_member_enabled=aciepg_preferred_group_member_enabled,
             proxy_arp_enabled=aciepg_proxy_arp_enabled,
         )
-        super().setUp()
 
     def test_create_aci_endpoint_group(self) -> None:
         """Test type and values of created ACI Endpoint Group."""
         self.assertTrue(isinstance(self.aci_epg, ACIEndpointGroup))
         self.assertEqual(self.aci_epg.__str__(), self.aci_epg.name)
-        self.assertEqual(self.aci_epg.name_alias, "TestingEPG")
-        self.assertEqual(
-            self.aci_epg.description, "EPG for NetBox ACI Plugin testing"
-        )
         self.assertTrue(isinstance(self.aci_epg.aci_tenant, ACITenant))
         self.assertEqual(self.aci_epg.aci_tenant.name, "ACITestTenant1")
         self.assertTrue(
@@ -607,40 +695,59 @@ class ACIEndpointGroupTestCase(TestCase):
         self.assertEqual(self.aci_epg.aci_bridge_domain.name, "BDTest1")
         self.assertTrue(isinstance(self.aci_epg.nb_tenant, Tenant))
         self.assertEqual(self.aci_epg.nb_tenant.name, "NetBox Tenant")
-        self.assertEqual(self.aci_epg.admin_shutdown, False)
-        self.assertEqual(
-            self.aci_epg.custom_qos_policy_name, "CustomQoSPolicy1"
+        expected_values: tuple = (
+            ("name_alias", "TestingEPG"),
+            ("description", "EPG for NetBox ACI Plugin testing"),
+            ("admin_shutdown", False),
+            ("custom_qos_policy_name", "CustomQoSPolicy1"),
+            ("flood_in_encap_enabled", False),
+            ("intra_epg_isolation_enabled", False),
+            ("qos_class", "level3"),
+            ("preferred_group_member_enabled", False),
+            ("proxy_arp_enabled", False),
+        )
+        self.assertAttributeValues(self.aci_epg, expected_values)
+
+    def test_constraint_unique_aci_endpoint_group_name_per_aci_app_profile(
+        self,
+    ) -> None:
+        """Test unique constraint of ACI EPG name per ACI App Profile."""
+        app_profile = ACIAppProfile.objects.get(name="AppProfileTest1")
+        bd = ACIBridgeDomain.objects.get(name="BDTest1")
+        epg = ACIEndpointGroup(
+            name="EPGTest1", aci_app_profile=app_profile, aci_bridge_domain=bd
         )
-        self.assertEqual(self.aci_epg.flood_in_encap_enabled, False)
-        self.assertEqual(self.aci_epg.intra_epg_isolation_enabled, False)
-        self.assertEqual(self.aci_epg.qos_class, "level3")
-        self.assertEqual(self.aci_epg.preferred_group_member_enabled, False)
-        self.assertEqual(self.aci_epg.proxy_arp_enabled, False)
+        self.assertRaises(IntegrityError, epg.save)
+
+
+class ACIEndpointGroupValidationTestCase(SimpleTestCase):
+    """Test case for ACIEndpointGroup model field validation."""
 
     def test_invalid_aci_endpoint_group_name(self) -> None:
         """Test validation of ACI Endpoint Group naming."""
         epg = ACIEndpointGroup(name="ACI EPG Test 1")
-        self.assertRaises(ValidationError, epg.full_clean)
+        self.assertRaises(
+            ValidationError,
+            epg.clean_fields,
+            exclude=_fields_except(ACIEndpointGroup, "name"),
+        )
 
     def test_invalid_aci_endpoint_group_name_alias(self) -> None:
         """Test validation of ACI Endpoint Group aliasing."""
         epg = ACIEndpointGroup(name="ACIEPGTest1", name_alias="Invalid Alias")
-        self.assertRaises(ValidationError, epg.full_clean)
+        self.assertRaises(
+            ValidationError,
+            epg.clean_fields,
+            exclude=_fields_except(ACIEndpointGroup, "name_alias"),
+        )
 
     def test_invalid_aci_endpoint_group_description(self) -> None:
         """Test validation of ACI Endpoint Group description."""
         epg = ACIEndpointGroup(
             name="ACIEPGTest1", description="Invalid Description: ö"
         )
-        self.assertRaises(ValidationError, epg.full_clean)
-
-    def test_constraint_unique_aci_endpoint_group_name_per_aci_app_profile(
-        self,
-    ) -> None:
-        """Test unique constraint of ACI EPG name per ACI App Profile."""
-        app_profile = ACIAppProfile.objects.get(name="AppProfileTest1")
-        bd = ACIBridgeDomain.objects.get(name="BDTest1")
-        epg = ACIEndpointGroup(
-            name="EPGTest1", aci_app_profile=app_profile, aci_bridge_domain=bd
+        self.assertRaises(
+            ValidationError,
+            epg.clean_fields,
+            exclude=_fields_except(ACIEndpointGroup, "description"),
         )
-        self.assertRaises(IntegrityError, epg.save)
@@ -2,6 +2,10 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import os
+import subprocess
+import sys
+
 from django.conf import settings
 from django.test import TestCase
 from netbox.plugins.navigation import PluginMenu, PluginMenuItem
@@ -15,6 +19,10 @@ class PluginTest(TestCase):
     menu_group_count: int = 1
     menu_name: str = "ACI"
     menu_tenant_item_count = 6
+    forbidden_at_setup: tuple = (
+        "netbox_aci_plugin.forms",
+        "netbox_aci_plugin.views",
+    )
 
     def test_configuration(self) -> None:
         """Test for plugin configuration in NetBox."""
@@ -39,3 +47,22 @@ class PluginTest(TestCase):
         self.assertIsInstance(
             menu_plugin_reg_groups[0].items[0], PluginMenuItem
         )
+
+    def test_setup_does_not_load_forms_and_views(self) -> None:
+        """Test Django setup with the plugin loads no forms or views."""
+        script = "import sys, django; django.setup(); print(*sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            capture_output=True,
+            env={
+                **os.environ,
+                "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE,
+                "PYTHONPATH": os.pathsep.join(sys.path),
+            },
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        loaded_modules = result.stdout.split()
+        for module in self.forbidden_at_setup:
+            with self.subTest(module=module):
+                self.assertNotIn(module, loaded_modules)
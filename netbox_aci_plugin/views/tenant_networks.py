@@ -147,9 +147,10 @@ class ACIVRFListView(generic.ObjectListView):
 class ACIVRFEditView(generic.ObjectEditView):
     """Edit view for editing an object of ACI VRF."""
 
-    queryset = ACIVRF.objects.prefetch_related(
+    queryset = ACIVRF.objects.select_related(
         "aci_tenant",
         "nb_tenant",
+    ).prefetch_related(
         "tags",
     )
     form = ACIVRFForm
@@ -257,9 +258,10 @@ class ACIBridgeDomainListView(generic.ObjectListView):
 class ACIBridgeDomainEditView(generic.ObjectEditView):
     """Edit view for editing an object of ACI Bridge Domain."""
 
-    queryset = ACIBridgeDomain.objects.prefetch_related(
+    queryset = ACIBridgeDomain.objects.select_related(
         "aci_vrf",
         "nb_tenant",
+    ).prefetch_related(
         "tags",
     )
     form = ACIBridgeDomainForm
@@ -385,10 +387,11 @@ class ACIBridgeDomainSubnetListView(generic.ObjectListView):
 class ACIBridgeDomainSubnetEditView(generic.ObjectEditView):
     """Edit view for editing an object of ACI BD Subnet."""
 
-    queryset = ACIBridgeDomainSubnet.objects.prefetch_related(
-        "aci_bridge_domain",
+    queryset = ACIBridgeDomainSubnet.objects.select_related(
+        "aci_bridge_domain__aci_vrf",
         "gateway_ip_address",
         "nb_tenant",
+    ).prefetch_related(
         "tags",
     )
     form = ACIBridgeDomainSubnetForm